@@ -20,11 +20,47 @@ Contains the AlternatingSectorsChain class. See
 
 from qubovert.utils import QUSOMatrix, boolean_to_spin, solution_type
 from qubovert.problems import Problem
+import numpy as np
 
 
 __all__ = 'AlternatingSectorsChain',
 
 
+def _fill_strengths(N, chain_length, min_strength, max_strength, out):
+    """_fill_strengths.
+
+    Fill ``out`` with the coupling strengths of the open chain, so that
+    ``out[q]`` is the strength of the coupling between spins ``q`` and
+    ``q+1``.
+
+    Parameters
+    ----------
+    N : int.
+        Number of variables in the chain.
+    chain_length : number.
+        The length of a chain of couples.
+    min_strength : number.
+        The strength of the couples for the minimum chain.
+    max_strength : number.
+        The strength of the couples for the maximum chain.
+    out : one-dim numpy array of length ``N-1``.
+        Preallocated array that the strengths are written into.
+
+    Return
+    ------
+    out : one-dim numpy array.
+        The same array that was passed in.
+
+    """
+    # odd sectors get the min strength. ``chain_length`` is not required to
+    # be an int, so compute the sector of every coupling rather than
+    # repeating a per-sector strength.
+    parity = (np.arange(N-1) // chain_length) % 2
+    strengths = np.array([max_strength, min_strength], dtype=out.dtype)
+    out[:] = strengths[parity.astype(np.intp)]
+    return out
+
+
 class AlternatingSectorsChain(Problem):
     """AlternatingSectorsChain.
 
@@ -99,6 +135,59 @@ class AlternatingSectorsChain(Problem):
         elif chain_length < 2:
             raise ValueError("Chain length must be at least 2")
 
+        # array of the open chain strengths, built when first needed by
+        # ``to_quso_arrays``. See ``_open_strengths``.
+        self._strengths = None
+
+    def _open_strengths(self):
+        """_open_strengths.
+
+        Return the array of the open chain strengths, such that element
+        ``q`` is the strength of the coupling between spins ``q`` and
+        ``q+1``. The array is built the first time this is called and
+        reused afterwards, so it must not be modified. It is only used by
+        ``to_quso_arrays``.
+
+        Return
+        ------
+        strengths : one-dim numpy array.
+
+        """
+        if self._strengths is None:
+            # only use a numeric dtype if both strengths have the same type,
+            # so that ie an int and a float aren't both cast to float. numpy
+            # also falls back to an object array for strengths that it has no
+            # numeric type for, ie very large ints or fractions.Fraction.
+            if type(self._max_strength) is type(self._min_strength):
+                dtype = np.array(
+                    [self._max_strength, self._min_strength]
+                ).dtype
+            else:
+                dtype = object
+            self._strengths = _fill_strengths(
+                self._N, self._chain_length,
+                self._min_strength, self._max_strength,
+                np.empty(self._N-1, dtype=dtype)
+            )
+        return self._strengths
+
+    def _wrap_strength(self):
+        """_wrap_strength.
+
+        Return the strength of the coupling between the last and first spin
+        that is added with periodic boundary conditions.
+
+        Return
+        ------
+        strength : number.
+
+        """
+        return (
+            self._min_strength
+            if ((self._N-1) // self._chain_length) % 2
+            else self._max_strength
+        )
+
     @property
     def num_binary_variables(self):
         """num_binary_variables.
@@ -146,24 +235,75 @@ class AlternatingSectorsChain(Problem):
         {(0, 1): 5, (1, 2): 5, (2, 3): 5, (3, 4): 1, (4, 5): 1}
 
         """
+        # read the attributes once rather than on every coupling.
+        N, chain_length = self._N, self._chain_length
+        min_strength, max_strength = self._min_strength, self._max_strength
+
         L = QUSOMatrix()
 
-        for q in range(self._N-1):
+        for q in range(N-1):
             L[(q, q+1)] = (
-                self._min_strength
-                if (q // self._chain_length) % 2
-                else self._max_strength
+                min_strength if (q // chain_length) % 2 else max_strength
             )
 
         if pbc:
-            L[(self._N-1, 0)] = (
-                self._min_strength
-                if ((self._N-1) // self._chain_length) % 2
-                else self._max_strength
-            )
+            L[(N-1, 0)] = self._wrap_strength()
 
         return L
 
+    def to_quso_arrays(self, pbc=False):
+        """to_quso_arrays.
+
+        Create and return the couplings of the QUSO as three parallel arrays
+        in coordinate form, such that ``vals[i]`` is the coupling between
+        spins ``rows[i]`` and ``cols[i]``. These are the same couplings as
+        ``to_quso`` has, but avoids building a dictionary for solvers that
+        take their couplings as arrays.
+
+        Parameters
+        ----------
+        pbc: bool (optional, defaults to False).
+            Whether or not to use periodic boundary conditions. When there
+            are fewer than three spins, the periodic coupling is not a new
+            coupling between two different spins, and is not included.
+
+        Return
+        ------
+        rows : one-dim numpy array of ints.
+        cols : one-dim numpy array of ints.
+        vals : one-dim numpy array.
+            Has an object dtype unless both strengths are of the same type
+            and numpy has a numeric type for them. Only couplings between
+            two different spins are represented, so any offset in
+            ``to_quso`` is not included. This only matters with one spin
+            and periodic boundary conditions, where ``to_quso`` is just a
+            constant.
+
+        Example
+        -------
+        >>> args = n, l, min_s, max_s = 6, 3, 1, 5
+        >>> problem = AlternatingSectorsChain(*args)
+        >>> rows, cols, vals = problem.to_quso_arrays(pbc=True)
+        >>> rows
+        array([0, 1, 2, 3, 4, 5])
+        >>> cols
+        array([1, 2, 3, 4, 5, 0])
+        >>> vals
+        array([-5, -5, -5, -1, -1, -1])
+
+        """
+        N = self._N
+        if pbc and N > 2:
+            rows, cols = np.arange(N), np.arange(1, N+1)
+            cols[-1] = 0
+            vals = np.append(self._open_strengths(), self._wrap_strength())
+        else:
+            rows, cols = np.arange(N-1), np.arange(1, N)
+            # copy so that changes to ``vals`` don't affect the problem.
+            vals = self._open_strengths().copy()
+
+        return rows, cols, vals
+
     def convert_solution(self, solution, spin=False):
         """convert_solution.
 
@@ -202,7 +342,15 @@ class AlternatingSectorsChain(Problem):
 
         """
         if isinstance(solution, dict):
-            solution = tuple(v for _, v in sorted(solution.items()))
+            # solvers usually label the variables 0, ..., N-1, in which case
+            # we can read them off in order without sorting. Use get so that
+            # dict subclasses with __missing__ (ie defaultdict) aren't changed.
+            missing = object()
+            values = tuple(solution.get(i, missing)
+                           for i in range(len(solution)))
+            if any(v is missing for v in values):
+                values = tuple(v for _, v in sorted(solution.items()))
+            solution = values
         sol_type = solution_type(solution, 'spin' if spin else 'bool')
         if sol_type == 'bool':
             return boolean_to_spin(solution)
@@ -242,8 +390,8 @@ class AlternatingSectorsChain(Problem):
         if isinstance(solution, dict):
             solution = self.convert_solution(solution, spin)
 
-        return all(
-            x == 1 for x in solution
-        ) or all(
-            x != 1 for x in solution
-        )
+        # valid if every element agrees with the first on whether it is 1.
+        # Walks the solution once and stops at the first disagreement.
+        it = iter(solution)
+        first = next(it, None) == 1
+        return all((x == 1) == first for x in it)
@@ -21,7 +21,9 @@ from qubovert.utils import (
     solve_qubo_bruteforce, solve_quso_bruteforce,
     solve_pubo_bruteforce, solve_puso_bruteforce
 )
-from numpy import allclose
+from numpy import allclose, float64
+from collections import defaultdict
+from fractions import Fraction
 from numpy.testing import assert_raises
 
 
@@ -54,6 +56,31 @@ def test_AlternatingSectorsChain_bruteforce():
     )
 
 
+def test_AlternatingSectorsChain_convert_solution_dict():
+
+    p = AlternatingSectorsChain(4)
+    assert p.convert_solution({3: 1, 0: 0, 2: 1, 1: 0}) == (1, 1, -1, -1)
+    assert p.convert_solution({3: 1, 1: -1, 2: 1, 0: -1}) == (-1, -1, 1, 1)
+    # labels that aren't 0, ..., N-1 are sorted
+    assert p.convert_solution({7: 1, 2: 0, 5: 1, 3: 0}) == (1, 1, -1, -1)
+
+    # missing labels must not be filled in by a defaultdict
+    sol = defaultdict(int, {1: 1, 2: 1, 3: 1})
+    assert p.convert_solution(sol) == (-1, -1, -1)
+    assert sol == {1: 1, 2: 1, 3: 1}
+
+
+def test_AlternatingSectorsChain_is_solution_valid():
+
+    assert problem.is_solution_valid((1,) * 12)
+    assert problem.is_solution_valid((-1,) * 12)
+    assert problem.is_solution_valid([0] * 12)
+    assert not problem.is_solution_valid((1,) * 11 + (-1,))
+    assert not problem.is_solution_valid((-1,) + (1,) * 11)
+    assert not problem.is_solution_valid([0] * 6 + [1] * 6)
+    assert not problem.is_solution_valid({i: i % 2 for i in range(12)})
+
+
 # QUBO
 
 def test_AlternatingSectorsChain_qubo_solve():
@@ -111,6 +138,110 @@ def test_AlternatingSectorsChain_quso_solve():
     assert allclose(e, -65)
 
 
+def test_AlternatingSectorsChain_quso_arrays():
+
+    for pbc in (False, True):
+        rows, cols, vals = problem.to_quso_arrays(pbc)
+        assert len(rows) == len(cols) == len(vals) == (12 if pbc else 11)
+        assert problem.to_quso(pbc) == {
+            (min(i, j), max(i, j)): v
+            for i, j, v in zip(rows.tolist(), cols.tolist(), vals.tolist())
+        }
+
+    # the returned arrays belong to the caller
+    rows, cols, vals = problem.to_quso_arrays()
+    vals[:] = 0
+    assert (
+        problem.to_quso_arrays()[2].tolist() ==
+        [-10] * 3 + [-1] * 3 + [-10] * 3 + [-1] * 2
+    )
+
+    # one spin; the periodic coupling is an offset, which arrays don't have
+    p = AlternatingSectorsChain(1)
+    assert p.to_quso(True) == {(): -10}
+    for pbc in (False, True):
+        rows, cols, vals = p.to_quso_arrays(pbc)
+        assert len(rows) == len(cols) == len(vals) == 0
+
+    rows, cols, vals = AlternatingSectorsChain(2).to_quso_arrays(True)
+    assert rows.tolist() == [0] and cols.tolist() == [1]
+    assert vals.tolist() == [-10]
+
+
+def test_AlternatingSectorsChain_large():
+
+    for n, length in ((2000, 3), (2001, 7)):
+        p = AlternatingSectorsChain(n, length, 2, 5)
+        for pbc in (False, True):
+            L = p.to_quso(pbc)
+            assert L.num_binary_variables == n
+            assert len(L) == (n if pbc else n - 1)
+            for q in range(n - 1 + pbc):
+                assert L[(q, (q+1) % n)] == (-2 if (q // length) % 2 else -5)
+
+
+def test_AlternatingSectorsChain_float_strengths():
+
+    # the strengths must be picked exactly, not computed from each other.
+    for n in (8, 2000):
+        p = AlternatingSectorsChain(n, 2, 1e-17, 1.0)
+        L = p.to_quso(True)
+        assert len(L) == n
+        for q in range(n):
+            assert L[(q, (q+1) % n)] == (-1e-17 if (q // 2) % 2 else -1.0)
+        assert p.to_quso_arrays(True)[2].tolist() == [
+            -1e-17 if (q // 2) % 2 else -1.0 for q in range(n)
+        ]
+
+        inf = float('inf')
+        p = AlternatingSectorsChain(n, 2, 1, inf)
+        L = p.to_quso(True)
+        for q in range(n):
+            assert L[(q, (q+1) % n)] == (-1 if (q // 2) % 2 else -inf)
+
+
+def test_AlternatingSectorsChain_nonnumpy_strengths():
+
+    # strengths that numpy has no numeric type for
+    for min_strength in (2**70, Fraction(1, 3)):
+        for n in (5, 2000):
+            p = AlternatingSectorsChain(n, 2, min_strength)
+            expected = [
+                -min_strength if (q // 2) % 2 else -10 for q in range(n)
+            ]
+            L = p.to_quso(True)
+            assert [L[(q, (q+1) % n)] for q in range(n)] == expected
+            assert p.to_quso_arrays(True)[2].tolist() == expected
+
+
+def test_AlternatingSectorsChain_mixed_strengths():
+
+    # an int and a float strength must each keep their own type and value
+    for min_strength, max_strength in ((2**60 + 1, 0.5), (1, 2.5)):
+        p = AlternatingSectorsChain(2000, 3, min_strength, max_strength)
+        expected = [
+            -min_strength if (q // 3) % 2 else -max_strength
+            for q in range(2000)
+        ]
+        L = p.to_quso(True)
+        values = [L[(q, (q+1) % 2000)] for q in range(2000)]
+        arrays = p.to_quso_arrays(True)[2].tolist()
+        for vals in (values, arrays):
+            assert vals == expected
+            assert [type(v) for v in vals] == [type(v) for v in expected]
+
+
+def test_AlternatingSectorsChain_float_chain_length():
+
+    # chain_length only has to be at least 2, it need not be an int.
+    for length in (2.5, float64(3)):
+        p = AlternatingSectorsChain(20, length)
+        expected = [-1 if (q // length) % 2 else -10 for q in range(20)]
+        L = p.to_quso(True)
+        assert [L[(q, (q+1) % 20)] for q in range(20)] == expected
+        assert p.to_quso_arrays(True)[2].tolist() == expected
+
+
 def test_AlternatingSectorsChain_quso_numvars():
 
     L = problem.to_quso()